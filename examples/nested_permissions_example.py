@@ -23,7 +23,7 @@ django.setup()
 
 from django.contrib.auth import get_user_model
 from turbodrf.models import TurboDRFRole, RolePermission, UserRole
-from turbodrf.validation import check_nested_field_permissions
+from turbodrf.validation import check_nested_field_permissions_many
 from turbodrf.backends import build_permission_snapshot
 
 # Assuming models from test suite
@@ -128,8 +128,10 @@ def test_full_access():
         'author__publisher__revenue',
     ]
 
+    # One batch: the shared author__ / author__publisher__ hops are checked once
+    results = check_nested_field_permissions_many(Book, test_fields, user)
     for field in test_fields:
-        has_permission = check_nested_field_permissions(Book, field, user)
+        has_permission = results[field]
         status = "✓ ALLOWED" if has_permission else "✗ DENIED"
         print(f"  {status}: {field}")
 
@@ -153,8 +155,11 @@ def test_limited_access():
         ('author__publisher__revenue', False),  # Blocked at publisher level
     ]
 
+    results = check_nested_field_permissions_many(
+        Book, [field for field, _ in test_fields], user
+    )
     for field, expected in test_fields:
-        has_permission = check_nested_field_permissions(Book, field, user)
+        has_permission = results[field]
         status = "✓ ALLOWED" if has_permission else "✗ DENIED"
         match = "✓" if has_permission == expected else "✗ UNEXPECTED"
         print(f"  {status}: {field} {match}")
@@ -179,8 +184,11 @@ def test_field_restrictions():
         ('author__ssn', False),  # NO explicit permission
     ]
 
+    results = check_nested_field_permissions_many(
+        Book, [field for field, _ in test_fields], user
+    )
     for field, expected in test_fields:
-        has_permission = check_nested_field_permissions(Book, field, user)
+        has_permission = results[field]
         status = "✓ ALLOWED" if has_permission else "✗ DENIED"
         match = "✓" if has_permission == expected else "✗ UNEXPECTED"
         print(f"  {status}: {field} {match}")
@@ -229,12 +237,13 @@ def test_filter_permissions():
         ('author__publisher__name', False),  # NO publisher access
     ]
 
-    from turbodrf.validation import validate_filter_field
+    from turbodrf.validation import validate_and_authorize_filter
 
     for filter_param, expected in test_filters:
         try:
-            field_path, lookup = validate_filter_field(Book, filter_param)
-            has_permission = check_nested_field_permissions(Book, field_path, user)
+            field_path, lookup, has_permission = validate_and_authorize_filter(
+                Book, filter_param, user
+            )
 
             status = "✓ ALLOWED" if has_permission else "✗ DENIED"
             match = "✓" if has_permission == expected else "✗ UNEXPECTED"
@@ -3,20 +3,42 @@
 Update coverage badge in README.md with current coverage percentage.
 
 This script:
-1. Runs tests with coverage
+1. Runs tests with coverage (or, with --reuse, reads a fresh coverage.json)
 2. Extracts the coverage percentage
 3. Updates the README.md badge
 
 Usage:
-    python scripts/update_coverage_badge.py
+    python scripts/update_coverage_badge.py              # re-run pytest
+    python scripts/update_coverage_badge.py --reuse      # reuse coverage.json
+    python scripts/update_coverage_badge.py --reuse --max-age 3600
 """
 
+import argparse
+import bisect
 import json
 import re
 import subprocess
 import sys
+import time
 from pathlib import Path
 
+try:
+    import ijson
+except ImportError:  # ijson>=3.1 ships with the dev extra; fall back to json
+    ijson = None
+
+# Matches: [![Coverage](https://img.shields.io/badge/coverage-XX%25-color)]...
+BADGE_RE = re.compile(
+    r"\[!\[Coverage\]\(https://img\.shields\.io/badge/coverage-[\d.]+%25-\w+\)\]"
+)
+# Matches a commented-out badge: <!-- [![Coverage](...) -->
+COMMENT_RE = re.compile(r"<!-- \[!\[Coverage\].*?\) -->")
+
+# Lower bound of each color band, ascending; _BADGE_COLORS[i] covers
+# _BADGE_THRESHOLDS[i - 1] <= percentage < _BADGE_THRESHOLDS[i].
+_BADGE_THRESHOLDS = (50, 60, 70, 80, 90)
+_BADGE_COLORS = ("red", "orange", "yellow", "yellowgreen", "green", "brightgreen")
+
 
 def run_coverage():
     """Run pytest with coverage and generate JSON report."""
@@ -45,27 +67,28 @@ def get_coverage_percentage():
         print("Error: coverage.json not found!")
         sys.exit(1)
 
-    with open(coverage_file) as f:
-        coverage_data = json.load(f)
+    if ijson is not None:
+        # Stream just totals.percent_covered instead of materialising the
+        # per-file report, which runs to tens of MB on large codebases
+        with open(coverage_file, "rb") as f:
+            percentage = next(
+                ijson.items(f, "totals.percent_covered", use_float=True), None
+            )
+        if percentage is None:
+            print("Error: totals.percent_covered missing from coverage.json!")
+            sys.exit(1)
+    else:
+        # json.loads accepts bytes directly — no separate text-decode pass
+        coverage_data = json.loads(coverage_file.read_bytes())
+        percentage = coverage_data["totals"]["percent_covered"]
 
-    percentage = coverage_data["totals"]["percent_covered"]
     return round(percentage, 2)
 
 
 def get_badge_color(percentage):
     """Get badge color based on coverage percentage."""
-    if percentage >= 90:
-        return "brightgreen"
-    elif percentage >= 80:
-        return "green"
-    elif percentage >= 70:
-        return "yellowgreen"
-    elif percentage >= 60:
-        return "yellow"
-    elif percentage >= 50:
-        return "orange"
-    else:
-        return "red"
+    # bisect_right: a percentage exactly on a threshold takes the upper band
+    return _BADGE_COLORS[bisect.bisect_right(_BADGE_THRESHOLDS, percentage)]
 
 
 def update_readme(percentage):
@@ -81,28 +104,20 @@ def update_readme(percentage):
 
     color = get_badge_color(percentage)
 
-    # Pattern to match the coverage badge
-    # Matches: [![Coverage](https://img.shields.io/badge/coverage-XX%25-color)]...
-    pattern = (
-        r"\[!\[Coverage\]\(https://img\.shields\.io/badge/coverage-[\d.]+%25-\w+\)\]"
-    )
-
     # New badge
     new_badge = (
         f"[![Coverage](https://img.shields.io/badge/coverage-{percentage}%25-{color})]"
     )
 
-    # Check if badge exists
-    if re.search(pattern, content):
-        # Update existing badge
-        content = re.sub(pattern, new_badge, content)
+    # Update existing badge (subn: one scan to both find and replace)
+    content, replaced = BADGE_RE.subn(new_badge, content)
+    if replaced:
         print(f"Updated existing coverage badge to {percentage}%")
     else:
         # Badge doesn't exist, look for commented badge
-        comment_pattern = r"<!-- \[!\[Coverage\].*?\) -->"
-        if re.search(comment_pattern, content):
-            # Replace commented badge
-            content = re.sub(comment_pattern, new_badge, content)
+        content, replaced = COMMENT_RE.subn(new_badge, content)
+        if replaced:
+            # Replaced commented badge
             print(f"Uncommented and set coverage badge to {percentage}%")
         else:
             print("Warning: Could not find coverage badge in README.md")
@@ -117,14 +132,54 @@ def update_readme(percentage):
     return True
 
 
-def main():
+def needs_rebuild(reuse=False, max_age=None):
+    """Whether pytest must run, or an existing coverage.json can be reused."""
+    # coverage.json is committed, so a checked-out copy is always stale and
+    # its mtime is the checkout time — reuse must be asked for explicitly
+    if not reuse:
+        return True
+    try:
+        mtime = Path("coverage.json").stat().st_mtime
+    except FileNotFoundError:
+        return True
+    if max_age is not None and time.time() - mtime > max_age:
+        print(f"coverage.json is older than {max_age}s, regenerating")
+        return True
+    return False
+
+
+def parse_args(argv=None):
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Update the README coverage badge.")
+    parser.add_argument(
+        "--reuse",
+        action="store_true",
+        help="Use an existing coverage.json instead of re-running pytest",
+    )
+    parser.add_argument(
+        "--max-age",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="With --reuse, regenerate coverage.json if older than this",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Main function."""
+    args = parse_args(argv)
+
     print("=" * 60)
     print("Updating Coverage Badge")
     print("=" * 60)
 
-    # Run coverage
-    run_coverage()
+    # Run coverage unless the caller vouches for a fresh report (e.g. CI's
+    # pytest --cov step just wrote one)
+    if needs_rebuild(args.reuse, args.max_age):
+        run_coverage()
+    else:
+        print("Using existing coverage.json (drop --reuse to re-run tests)")
 
     # Get percentage
     percentage = get_coverage_percentage()
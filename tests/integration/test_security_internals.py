@@ -609,9 +609,10 @@ class InternalHelperTests(AdversaryBase):
         s1 = attach_snapshot_to_request(req, SampleModel)
         s2 = attach_snapshot_to_request(req, SampleModel)
         self.assertIs(s1, s2)
-        # In-memory mutation does not leak to a fresh build
+        # Snapshots are immutable, and a fresh build is a new object
         snap = build_permission_snapshot(self.victim, Deal, use_cache=False)
-        snap.allowed_actions.add("read")
+        with self.assertRaises(AttributeError):
+            snap.allowed_actions.add("read")
         fresh = build_permission_snapshot(self.victim, Deal, use_cache=False)
         self.assertIsNot(fresh, snap)
 
@@ -1898,13 +1899,16 @@ class LoggingSecurityTests(AdversaryBase):
                 self.assertNotIn(s, body)
 
     def test_log_format_string_contracts(self):
-        """Source-level checks: views.py has no logger calls; serializers
-        uses DEBUG-level for stripping; keycloak uses %r for role names;
+        """Source-level checks: views.py has no logger calls; the shared
+        visibility filter (validation.filter_visible_fields_many, used by
+        serializers) uses DEBUG-level for stripping; keycloak uses %r for
+        role names;
         compiler info log doesn't dump rows; router warning doesn't
         reference request.user/data."""
         from turbodrf import compiler as compiler_mod
         from turbodrf import router as router_mod
         from turbodrf import serializers as serializers_mod
+        from turbodrf import validation as validation_mod
         from turbodrf import views as views_mod
         from turbodrf.integrations import keycloak as keycloak_mod
 
@@ -1912,8 +1916,11 @@ class LoggingSecurityTests(AdversaryBase):
         self.assertNotIn("logger.", views_src)
         self.assertNotIn("logging.getLogger", views_src)
 
+        val_src = open(validation_mod.__file__).read()
+        self.assertIn('logger.debug(f"Stripping sensitive field', val_src)
+        self.assertNotIn('logger.warning(f"Stripping sensitive field', val_src)
         ser_src = open(serializers_mod.__file__).read()
-        self.assertIn('logger.debug(f"Stripping sensitive field', ser_src)
+        self.assertIn("filter_visible_fields_many(", ser_src)
         self.assertNotIn('logger.warning(f"Stripping sensitive field', ser_src)
 
         kc_src = open(keycloak_mod.__file__).read()
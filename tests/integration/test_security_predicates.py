@@ -841,19 +841,38 @@ class TestSelectRelatedAndDetail(SecurityBase):
 
 class TestSignals(SecurityBase):
     def test_no_turbodrf_production_signal_handlers(self):
-        """No signal receiver in turbodrf.* mucks with tenant data."""
+        """No signal receiver in turbodrf.* mucks with tenant data.
+
+        The only turbodrf receiver allowed is the process-local permission
+        snapshot invalidation, bound to turbodrf's own role models.
+        """
         from django.db.models.signals import (
             post_delete,
             post_save,
             pre_delete,
             pre_save,
         )
+        from django.dispatch.dispatcher import _make_id
+
+        from turbodrf.backends import bump_role_version, clear_local_snapshot_cache
+        from turbodrf.models import RolePermission, TurboDRFRole, UserRole
+
+        role_models = {_make_id(m) for m in (TurboDRFRole, RolePermission, UserRole)}
+        allowed = {
+            clear_local_snapshot_cache: role_models,
+            bump_role_version: {_make_id(RolePermission)},
+        }
 
         for sig in (post_save, pre_save, post_delete, pre_delete):
-            for (lookup_key, receiver_id), ref in sig.receivers:
+            for entry in sig.receivers:
+                sender_id, ref = entry[0][1], entry[1]
                 receiver = ref() if callable(ref) else ref
                 if receiver is None:
                     continue
+                if sig in (post_save, post_delete) and sender_id in allowed.get(
+                    receiver, ()
+                ):
+                    continue
                 module = getattr(receiver, "__module__", "")
                 self.assertFalse(
                     module.startswith("turbodrf."),
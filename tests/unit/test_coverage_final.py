@@ -915,7 +915,7 @@ class TestFilterableFieldsAuthenticatedWithSnapshot(TestCase):
         result = viewset._get_filterable_fields()
         # Viewer has some readable fields defined, should return a set
         if result is not None:
-            self.assertIsInstance(result, set)
+            self.assertIsInstance(result, (set, frozenset))
             self.assertIn("title", result)
 
 
@@ -283,6 +283,125 @@ class TestPermissionSnapshot(TestCase):
         )
         self.assertTrue(snapshot2.can_perform_action("update"))
 
+    def test_database_snapshot_built_in_one_query(self):
+        """Roles and permissions load in a single JOIN query."""
+        from turbodrf.backends import build_permission_snapshot_database
+
+        with self.assertNumQueries(1):
+            snapshot = build_permission_snapshot_database(
+                self.editor_user, self.TestBook
+            )
+
+        self.assertEqual(snapshot.allowed_actions, {"read", "update"})
+        self.assertTrue(snapshot.can_write_field("price"))
+
+    def test_snapshot_is_slotted_and_frozen(self):
+        """Snapshots carry no __dict__, reject mutation and survive pickling."""
+        import dataclasses
+        import pickle
+
+        snapshot = build_permission_snapshot(
+            self.editor_user, self.TestBook, use_cache=False
+        )
+
+        self.assertFalse(hasattr(snapshot, "__dict__"))
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            snapshot.allowed_actions = {"delete"}
+        self.assertEqual(pickle.loads(pickle.dumps(snapshot)), snapshot)
+
+    def test_cache_key_carries_snapshot_format_version(self):
+        """A pickle-layout change must not share keys with older entries."""
+        from unittest.mock import patch
+
+        from turbodrf import backends
+
+        key = backends.get_cache_key(self.editor_user, self.TestBook)
+        self.assertIn(f":v{backends.SNAPSHOT_FORMAT_VERSION}:", key)
+        with patch.object(backends, "SNAPSHOT_FORMAT_VERSION", 1):
+            self.assertNotEqual(
+                backends.get_cache_key(self.editor_user, self.TestBook), key
+            )
+
+    def test_snapshot_sets_are_frozensets(self):
+        """Builders and direct construction both yield hashable frozensets."""
+        from turbodrf.backends import PermissionSnapshot
+
+        snapshot = build_permission_snapshot(
+            self.editor_user, self.TestBook, use_cache=False
+        )
+        manual = PermissionSnapshot(allowed_actions={"read"})
+
+        self.assertIs(type(snapshot.readable_fields), frozenset)
+        self.assertIs(type(manual.allowed_actions), frozenset)
+        self.assertIs(type(manual.readable_fields), frozenset)
+        self.assertEqual({snapshot: 1, manual: 2}[manual], 2)
+
+    def test_local_cache_serves_repeat_builds_without_shared_cache(self):
+        """A second build is served in-process, skipping the shared cache."""
+        from unittest.mock import patch
+
+        from django.core.cache import cache
+
+        cache.clear()
+        snapshot1 = build_permission_snapshot(self.viewer_user, self.TestBook)
+
+        with patch.object(cache, "get", side_effect=AssertionError("shared hit")):
+            snapshot2 = build_permission_snapshot(self.viewer_user, self.TestBook)
+
+        self.assertIs(snapshot1, snapshot2)
+
+    def test_queryset_delete_revokes_without_clearing_caches(self):
+        """A bulk delete bumps the role version (post_delete), so neither
+        the shared nor the local cache serves the revoked snapshot."""
+        from turbodrf.backends import get_cache_key
+
+        snapshot1 = build_permission_snapshot(self.viewer_user, self.TestBook)
+        self.assertTrue(snapshot1.can_perform_action("read"))
+        key = get_cache_key(self.viewer_user, self.TestBook)
+
+        RolePermission.objects.filter(role=self.viewer_role, action="read").delete()
+
+        self.assertNotEqual(get_cache_key(self.viewer_user, self.TestBook), key)
+        snapshot2 = build_permission_snapshot(self.viewer_user, self.TestBook)
+        self.assertFalse(snapshot2.can_perform_action("read"))
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+    )
+    def test_local_cache_skipped_with_dummy_cache(self):
+        """DummyCache turns permission caching off, local layer included:
+        a signal-less .update() is visible on the next build."""
+        from turbodrf import backends
+
+        snapshot1 = build_permission_snapshot(self.viewer_user, self.TestBook)
+        self.assertTrue(snapshot1.can_perform_action("read"))
+        self.assertEqual(len(backends._local_snapshots), 0)
+
+        RolePermission.objects.filter(role=self.viewer_role, action="read").update(
+            action="delete"
+        )
+
+        snapshot2 = build_permission_snapshot(self.viewer_user, self.TestBook)
+        self.assertFalse(snapshot2.can_perform_action("read"))
+
+    @override_settings(TURBODRF_PERMISSION_LOCAL_CACHE_SIZE=0)
+    def test_local_cache_disabled_with_zero_size(self):
+        from turbodrf import backends
+
+        build_permission_snapshot(self.viewer_user, self.TestBook)
+        self.assertEqual(len(backends._local_snapshots), 0)
+
+    @override_settings(TURBODRF_PERMISSION_LOCAL_CACHE_SIZE=1)
+    def test_local_cache_evicts_least_recently_used(self):
+        from turbodrf import backends
+
+        build_permission_snapshot(self.viewer_user, self.TestBook)
+        build_permission_snapshot(self.editor_user, self.TestBook)
+
+        self.assertEqual(len(backends._local_snapshots), 1)
+        (key,) = backends._local_snapshots
+        self.assertIn(f":{self.editor_user.pk}:", key)
+
 
 @override_settings(
     TURBODRF_PERMISSION_MODE="database", TURBODRF_DISABLE_PERMISSIONS=False
@@ -7,7 +7,7 @@ Tests the ORFilterBackend functionality for OR query support.
 from decimal import Decimal
 
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from rest_framework.request import Request
 from rest_framework.test import APIRequestFactory
 
@@ -223,3 +223,394 @@ class TestORFilterBackend(TestCase):
 
         # Should apply regular filters (backend handles both OR and regular params)
         self.assertEqual(filtered.count(), 1)
+
+    def test_or_and_regular_filters_applied_in_one_filter_call(self):
+        """OR groups and regular params are fused into a single .filter()."""
+        from unittest.mock import patch
+
+        from django.db.models import QuerySet
+
+        django_request = self.factory.get(
+            "/?title_or=Apple Product&title_or=Cherry Product"
+            "&is_active=True&quantity__gte=10"
+        )
+        request = Request(django_request)
+
+        queryset = SampleModel.objects.all()
+        original = QuerySet.filter
+        calls = []
+
+        def counting_filter(qs, *args, **kwargs):
+            if qs.model is SampleModel:
+                calls.append(args)
+            return original(qs, *args, **kwargs)
+
+        with patch.object(QuerySet, "filter", counting_filter):
+            filtered = self.backend.filter_queryset(request, queryset, self.view)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(filtered.count(), 2)
+
+    def test_uncoercible_value_dropped_other_filters_kept(self):
+        """A bad value drops only its own predicate, not the whole filter."""
+        django_request = self.factory.get("/?quantity=notanumber&is_active=True")
+        request = Request(django_request)
+
+        queryset = SampleModel.objects.all()
+        filtered = self.backend.filter_queryset(request, queryset, self.view)
+
+        self.assertEqual(filtered.count(), 2)
+        self.assertTrue(all(item.is_active for item in filtered))
+
+
+class TestORFilterBackendMultiValued(TestCase):
+    """Params across M2M relations keep Django's per-.filter() join semantics."""
+
+    def setUp(self):
+        from tests.test_app.models import ArticleWithCategories, Category
+
+        self.news = Category.objects.create(name="news", description="daily")
+        self.tech = Category.objects.create(name="tech", description="weekly")
+        self.article = ArticleWithCategories.objects.create(title="Mixed")
+        self.article.categories.add(self.news, self.tech)
+        self.model = ArticleWithCategories
+        self.backend = ORFilterBackend()
+        self.factory = APIRequestFactory()
+
+    def test_conditions_on_different_related_rows_still_match(self):
+        """name=news and description=weekly hold on DIFFERENT categories."""
+        django_request = self.factory.get(
+            "/?categories__name=news&categories__description=weekly"
+        )
+        request = Request(django_request)
+
+        filtered = self.backend.filter_queryset(
+            request, self.model.objects.all(), MockView()
+        )
+
+        self.assertEqual(list(filtered.distinct()), [self.article])
+
+
+class TestORFilterBackendAllowList(TestCase):
+    """Unknown params are rejected by the cached allow-list up front."""
+
+    def setUp(self):
+        self.backend = ORFilterBackend()
+        self.factory = APIRequestFactory()
+
+    def test_unknown_param_skips_permission_walk(self):
+        from unittest.mock import patch
+
+        request = Request(self.factory.get("/?no_such_field=1&bogus__icontains=x"))
+
+        with patch.object(ORFilterBackend, "_is_valid_filter_field") as check:
+            filtered = self.backend.filter_queryset(
+                request, SampleModel.objects.all(), MockView()
+            )
+
+        check.assert_not_called()
+        self.assertEqual(str(filtered.query), str(SampleModel.objects.all().query))
+
+    def test_allow_list_built_once_per_view_class(self):
+        from turbodrf.filter_backends import _allowed_filters
+
+        class StaticFilterView:
+            filterset_fields = {"price": ["gte"]}
+
+        first = _allowed_filters(StaticFilterView, SampleModel)
+        self.assertIs(_allowed_filters(StaticFilterView, SampleModel), first)
+        self.assertIn("price__gte", first)
+        self.assertIn("title", first)
+
+    def test_within_model_view_drops_miss_without_resolving(self):
+        from unittest.mock import patch
+
+        from turbodrf.views import TurboDRFViewSet
+
+        class View(TurboDRFViewSet):
+            model = SampleModel
+
+        request = Request(self.factory.get("/?no_such_field=1&bogus_or=x"))
+        with patch.object(TurboDRFViewSet, "get_filterset_fields") as resolve:
+            filtered = self.backend.filter_queryset(
+                request, SampleModel.objects.all(), View()
+            )
+
+        resolve.assert_not_called()
+        self.assertEqual(str(filtered.query), str(SampleModel.objects.all().query))
+
+    def test_viewset_subclass_adding_annotation_filter_is_honoured(self):
+        """Overriding get_filterset_fields drops the inherited within-model
+        shortcut, so an annotation it adds still filters."""
+        from django.db.models import F
+
+        from turbodrf.views import TurboDRFViewSet
+
+        class View(TurboDRFViewSet):
+            model = SampleModel
+
+            def get_filterset_fields(self):
+                fs = super().get_filterset_fields()
+                fs["double_qty"] = ["exact"]
+                return fs
+
+        related = RelatedModel.objects.create(name="Cat", description="desc")
+        SampleModel.objects.create(
+            title="A", price=Decimal("1.00"), quantity=2, related=related
+        )
+        SampleModel.objects.create(
+            title="B", price=Decimal("1.00"), quantity=3, related=related
+        )
+        queryset = SampleModel.objects.annotate(double_qty=F("quantity") * 2)
+        request = Request(self.factory.get("/?double_qty=4"))
+
+        filtered = self.backend.filter_queryset(request, queryset, View())
+
+        self.assertEqual([item.title for item in filtered], ["A"])
+
+    def test_dynamic_filterset_fields_resolved_on_miss(self):
+        """A property filterset_fields still admits names it declares."""
+        from django.db.models import F
+
+        class AnnotatedView:
+            @property
+            def filterset_fields(self):
+                return ["double_qty"]
+
+        related = RelatedModel.objects.create(name="Cat", description="desc")
+        SampleModel.objects.create(
+            title="A", price=Decimal("1.00"), quantity=2, related=related
+        )
+        SampleModel.objects.create(
+            title="B", price=Decimal("1.00"), quantity=3, related=related
+        )
+        queryset = SampleModel.objects.annotate(double_qty=F("quantity") * 2)
+        request = Request(self.factory.get("/?double_qty=4"))
+
+        filtered = self.backend.filter_queryset(request, queryset, AnnotatedView())
+
+        self.assertEqual([item.title for item in filtered], ["A"])
+
+
+class TestORFilterBackendInCollapse(TestCase):
+    """Exact-match OR groups compile to a single IN clause."""
+
+    def setUp(self):
+        self.related = RelatedModel.objects.create(name="Cat", description="desc")
+        for title in ("Apple", "Banana", "Cherry"):
+            SampleModel.objects.create(
+                title=title, price=Decimal("1.00"), quantity=1, related=self.related
+            )
+        self.backend = ORFilterBackend()
+        self.factory = APIRequestFactory()
+
+    def _filter(self, query):
+        request = Request(self.factory.get(query))
+        return self.backend.filter_queryset(
+            request, SampleModel.objects.all(), MockView()
+        )
+
+    def test_exact_or_group_uses_in(self):
+        filtered = self._filter("/?title_or=Apple&title_or=Cherry")
+
+        sql = str(filtered.query)
+        self.assertIn(" IN ", sql)
+        self.assertNotIn(" OR ", sql)
+        self.assertEqual(
+            sorted(filtered.values_list("title", flat=True)), ["Apple", "Cherry"]
+        )
+
+    def test_explicit_exact_or_group_uses_in(self):
+        filtered = self._filter("/?title__exact_or=Apple&title__exact_or=Banana")
+
+        self.assertIn(" IN ", str(filtered.query))
+        self.assertEqual(filtered.count(), 2)
+
+    def test_nested_exact_or_group_uses_in(self):
+        filtered = self._filter("/?related__name_or=Cat&related__name_or=Dog")
+
+        self.assertIn(" IN ", str(filtered.query))
+        self.assertEqual(filtered.count(), 3)
+
+    def test_or_values_reach_in_lookup_without_copy(self):
+        from unittest.mock import patch
+
+        from django.db.models import Q
+
+        request = Request(self.factory.get("/?title_or=Apple&title_or=Cherry"))
+        raw_values = dict.__getitem__(request.query_params, "title_or")
+        captured = []
+        original_init = Q.__init__
+
+        def spy(q, *args, **kwargs):
+            if "title__in" in kwargs:
+                captured.append(kwargs["title__in"])
+            original_init(q, *args, **kwargs)
+
+        with patch.object(Q, "__init__", spy):
+            self.backend.filter_queryset(request, SampleModel.objects.all(), MockView())
+
+        self.assertEqual(len(captured), 1)
+        self.assertIs(captured[0], raw_values)
+
+    def test_non_exact_lookup_keeps_or_chain(self):
+        filtered = self._filter("/?title__icontains_or=app&title__icontains_or=ban")
+
+        self.assertIn(" OR ", str(filtered.query))
+        self.assertEqual(filtered.count(), 2)
+
+    def test_non_exact_or_chain_is_one_q_node(self):
+        from unittest.mock import patch
+
+        from django.db.models import Q
+
+        request = Request(
+            self.factory.get("/?title__icontains_or=app&title__icontains_or=ban")
+        )
+        captured = []
+        original_init = Q.__init__
+
+        def spy(q, *args, **kwargs):
+            if ("title__icontains", "app") in args:
+                captured.append((args, kwargs.get("_connector")))
+            original_init(q, *args, **kwargs)
+
+        with patch.object(Q, "__init__", spy):
+            filtered = self.backend.filter_queryset(
+                request, SampleModel.objects.all(), MockView()
+            )
+
+        # First construction carries every value (later ones are ORM copies)
+        self.assertEqual(
+            captured[0],
+            ((("title__icontains", "app"), ("title__icontains", "ban")), Q.OR),
+        )
+        self.assertEqual(filtered.count(), 2)
+
+
+class TestORFilterBackendSkipParams(TestCase):
+    """Pagination / search / ordering params never reach filter parsing."""
+
+    def setUp(self):
+        self.backend = ORFilterBackend()
+        self.factory = APIRequestFactory()
+
+    def test_view_skip_reads_custom_param_names(self):
+        from rest_framework.filters import OrderingFilter, SearchFilter
+        from rest_framework.pagination import PageNumberPagination
+
+        from turbodrf.filter_backends import _view_skip
+
+        class Pager(PageNumberPagination):
+            page_query_param = "p"
+            page_size_query_param = "per_page"
+
+        class Search(SearchFilter):
+            search_param = "q"
+
+        class CustomView:
+            pagination_class = Pager
+            filter_backends = [Search, OrderingFilter, ORFilterBackend]
+
+        skip = _view_skip(CustomView)
+        self.assertTrue({"p", "per_page", "q", "ordering"} <= skip)
+        self.assertIs(_view_skip(CustomView), skip)
+
+    def test_view_skip_defaults_exclude_unused_paginator_params(self):
+        from turbodrf.filter_backends import _view_skip
+
+        # cursor / limit / offset are only skipped when a paginator reads them
+        skip = _view_skip(MockView)
+        self.assertFalse({"cursor", "limit", "offset"} & skip)
+
+    @override_settings(TURBODRF_MAX_FILTER_VALUE_LENGTH=5)
+    def test_long_cursor_token_not_treated_as_filter(self):
+        related = RelatedModel.objects.create(name="Cat", description="desc")
+        SampleModel.objects.create(
+            title="Apple", price=Decimal("1.00"), quantity=1, related=related
+        )
+        from rest_framework.pagination import CursorPagination
+
+        class CursorView:
+            pagination_class = CursorPagination
+
+        request = Request(self.factory.get("/?cursor=cD0yMDI0LTAx"))
+        filtered = self.backend.filter_queryset(
+            request, SampleModel.objects.all(), CursorView()
+        )
+
+        self.assertEqual(filtered.count(), 1)
+
+
+class TestORFilterBackendFastPath(TestCase):
+    """Requests without filter params return the queryset untouched."""
+
+    def setUp(self):
+        self.backend = ORFilterBackend()
+        self.factory = APIRequestFactory()
+
+    def test_no_params_skips_allow_list(self):
+        from unittest.mock import patch
+
+        queryset = SampleModel.objects.all()
+        with patch("turbodrf.filter_backends._allowed_filters") as allowed:
+            result = self.backend.filter_queryset(
+                Request(self.factory.get("/")), queryset, MockView()
+            )
+
+        self.assertIs(result, queryset)
+        allowed.assert_not_called()
+
+    def test_only_skipped_params_skip_scoping(self):
+        from unittest.mock import patch
+
+        queryset = SampleModel.objects.all()
+        request = Request(self.factory.get("/?page=2&ordering=title&bogus=1"))
+        with patch("turbodrf.validation.build_traversal_scope_q") as scope:
+            result = self.backend.filter_queryset(request, queryset, MockView())
+
+        self.assertIs(result, queryset)
+        scope.assert_not_called()
+
+
+class TestORFilterBackendInvalidOrValues(TestCase):
+    """An unusable value inside an ``_or`` group never widens the result."""
+
+    def setUp(self):
+        self.related = RelatedModel.objects.create(name="Cat", description="desc")
+        self.other = RelatedModel.objects.create(name="Dog", description="desc")
+        SampleModel.objects.create(
+            title="A", price=Decimal("1.00"), related=self.related, is_active=True
+        )
+        SampleModel.objects.create(
+            title="B", price=Decimal("1.00"), related=self.other, is_active=True
+        )
+        SampleModel.objects.create(
+            title="C", price=Decimal("1.00"), related=self.other, is_active=False
+        )
+        self.backend = ORFilterBackend()
+        self.factory = APIRequestFactory()
+
+    def _titles(self, query):
+        request = Request(self.factory.get(query))
+        filtered = self.backend.filter_queryset(
+            request, SampleModel.objects.all(), MockView()
+        )
+        return sorted(filtered.values_list("title", flat=True))
+
+    def test_bad_value_dropped_from_group_only(self):
+        self.assertEqual(
+            self._titles(f"/?related_or=abc&related_or={self.related.pk}"), ["A"]
+        )
+
+    def test_group_with_no_usable_value_matches_nothing(self):
+        self.assertEqual(
+            self._titles("/?is_active_or=true&is_active_or=false&title=A"), []
+        )
+
+    def test_bad_value_dropped_in_non_exact_group(self):
+        self.assertEqual(
+            self._titles("/?quantity__gte_or=abc&quantity__gte_or=0"),
+            ["A", "B", "C"],
+        )
+        self.assertEqual(self._titles("/?is_active_or=False&is_active_or=x"), ["C"])
@@ -373,3 +373,262 @@ class ValidatePermissionStringsTests(TestCase):
             with self.assertRaises(ImproperlyConfigured) as cm:
                 validate_permission_strings()
             self.assertIn("must be a string", str(cm.exception))
+
+
+class CheckNestedFieldPermissionsChainTests(TestCase):
+    def setUp(self):
+        self.user = Mock(is_authenticated=True, pk=1, _test_roles=["admin"])
+
+    def test_untraversable_path_denied_without_building_snapshots(self):
+        from unittest.mock import patch
+
+        from turbodrf.validation import check_nested_field_permissions
+
+        with patch("turbodrf.backends.build_permission_snapshot") as build:
+            allowed = check_nested_field_permissions(
+                SampleModel, "title__name", self.user
+            )
+
+        self.assertFalse(allowed)
+        build.assert_not_called()
+
+    def test_each_model_snapshot_built_once_per_walk(self):
+        from unittest.mock import patch
+
+        from turbodrf.backends import PermissionSnapshot
+        from turbodrf.validation import check_nested_field_permissions
+
+        snapshot = PermissionSnapshot(allowed_actions={"read"})
+        with patch(
+            "turbodrf.backends.build_permission_snapshot", return_value=snapshot
+        ) as build:
+            allowed = check_nested_field_permissions(
+                SampleModel, "related__test_models__title", self.user
+            )
+
+        self.assertTrue(allowed)
+        # SampleModel -> RelatedModel -> SampleModel: two distinct models
+        self.assertEqual(build.call_count, 2)
+
+    def test_path_field_check_matches_rule_then_action_fallback(self):
+        from turbodrf.backends import PermissionSnapshot
+
+        snapshot = PermissionSnapshot(
+            allowed_actions={"read"},
+            readable_fields={"title"},
+            fields_with_read_rules={"title", "price"},
+        )
+        self.assertTrue(snapshot.can_read_path_field("title"))
+        self.assertFalse(snapshot.can_read_path_field("price"))
+        # Not enumerated (e.g. a reverse relation): model-level read
+        self.assertTrue(snapshot.can_read_path_field("test_models"))
+        self.assertFalse(PermissionSnapshot().can_read_path_field("test_models"))
+
+    def test_batch_shares_snapshots_and_prefix_steps(self):
+        from unittest.mock import patch
+
+        from turbodrf.backends import PermissionSnapshot
+        from turbodrf.validation import check_nested_field_permissions_many
+
+        snapshot = PermissionSnapshot(allowed_actions={"read"})
+        paths = ["title", "related__name", "related__description", "title__name"]
+        build_patch = patch(
+            "turbodrf.backends.build_permission_snapshot", return_value=snapshot
+        )
+        step_patch = patch.object(
+            PermissionSnapshot, "can_read_path_field", return_value=True
+        )
+        with build_patch as build, step_patch as step:
+            results = check_nested_field_permissions_many(SampleModel, paths, self.user)
+
+        self.assertEqual(
+            results,
+            {
+                "title": True,
+                "related__name": True,
+                "related__description": True,
+                "title__name": False,
+            },
+        )
+        self.assertEqual(build.call_count, 2)
+        # title, related, name, description — the related hop is decided once
+        self.assertEqual(step.call_count, 4)
+
+    def test_visible_fields_batch_matches_single_check(self):
+        from unittest.mock import patch
+
+        from turbodrf.backends import PermissionSnapshot
+        from turbodrf.validation import (
+            filter_visible_fields_many,
+            is_field_visible_to_user,
+        )
+
+        snapshot = PermissionSnapshot(
+            allowed_actions={"read"}, fields_with_read_rules={"price"}
+        )
+        paths = ["title", "related__password", "price", "related__name"]
+        with patch(
+            "turbodrf.backends.build_permission_snapshot", return_value=snapshot
+        ):
+            expected = [
+                path
+                for path in paths
+                if is_field_visible_to_user(SampleModel, path, self.user)
+            ]
+            visible = filter_visible_fields_many(SampleModel, paths, self.user)
+
+        self.assertEqual(visible, expected)
+        self.assertEqual(visible, ["title", "related__name"])
+
+    def test_chain_resolution_is_cached(self):
+        from turbodrf.validation import _permission_chain
+
+        first = _permission_chain(SampleModel, "related__name")
+        self.assertIs(_permission_chain(SampleModel, "related__name"), first)
+        self.assertEqual(
+            first, (((SampleModel, "related"), (RelatedModel, "name")), None)
+        )
+
+
+class FieldPathResolutionCacheTests(TestCase):
+    def test_resolution_cached_and_callers_get_fresh_lists(self):
+        from turbodrf.validation import _resolve_field_chain, get_nested_field_model
+
+        _resolve_field_chain.cache_clear()
+        final_model, chain = get_nested_field_model(SampleModel, "related__name")
+        chain.append("mutated")
+        again_model, again_chain = get_nested_field_model(SampleModel, "related__name")
+
+        self.assertIs(final_model, RelatedModel)
+        self.assertIs(again_model, RelatedModel)
+        self.assertEqual(len(again_chain), 2)
+        self.assertEqual(_resolve_field_chain.cache_info().hits, 1)
+
+    def test_missing_field_error_is_cached_and_reraised(self):
+        from django.core.exceptions import FieldDoesNotExist
+
+        from turbodrf.validation import _resolve_field_chain, get_nested_field_model
+
+        _resolve_field_chain.cache_clear()
+        for _ in range(2):
+            with self.assertRaisesMessage(FieldDoesNotExist, "RelatedModel"):
+                get_nested_field_model(SampleModel, "related__missing")
+        self.assertEqual(_resolve_field_chain.cache_info().hits, 1)
+
+    def test_permission_chain_and_multi_valued_share_resolver(self):
+        from unittest.mock import patch
+
+        from turbodrf.validation import (
+            _permission_chain,
+            _resolve_field_chain,
+            path_spans_multi_valued,
+        )
+
+        _permission_chain.cache_clear()
+        _resolve_field_chain.cache_clear()
+        self.assertEqual(
+            _permission_chain(SampleModel, "related__test_models__title"),
+            (
+                (
+                    (SampleModel, "related"),
+                    (RelatedModel, "test_models"),
+                    (SampleModel, "title"),
+                ),
+                None,
+            ),
+        )
+        self.assertEqual(_resolve_field_chain.cache_info().currsize, 1)
+
+        multi = "related__test_models__title"
+        single = "related__name__icontains"
+        path_spans_multi_valued(SampleModel, multi)
+        path_spans_multi_valued(SampleModel, single)
+        # Second calls are served from the resolver cache, not _meta
+        with patch.object(SampleModel._meta, "get_field") as get_field:
+            self.assertTrue(path_spans_multi_valued(SampleModel, multi))
+            self.assertFalse(path_spans_multi_valued(SampleModel, single))
+        get_field.assert_not_called()
+
+    def test_permission_chain_broken_reasons(self):
+        from turbodrf.validation import _permission_chain
+
+        steps, broken = _permission_chain(SampleModel, "title__foo__bar")
+        self.assertIn("'title' on SampleModel is not a relational field", broken)
+        self.assertIn("'foo.bar'", broken)
+        self.assertEqual(steps, ((SampleModel, "title"),))
+
+        steps, broken = _permission_chain(SampleModel, "related__missing__name")
+        self.assertIn("'missing' does not exist on model RelatedModel", broken)
+        self.assertEqual(steps, ((SampleModel, "related"), (RelatedModel, "missing")))
+
+    def test_class_prepared_clears_caches(self):
+        from django.db.models.signals import class_prepared
+
+        from turbodrf.validation import _resolve_field_chain
+
+        _resolve_field_chain(SampleModel, "related__name")
+        class_prepared.send(sender=SampleModel)
+        self.assertEqual(_resolve_field_chain.cache_info().currsize, 0)
+
+    def test_model_lookup_cached_and_cleared_on_class_prepared(self):
+        from django.db.models.signals import class_prepared
+
+        from turbodrf.validation import get_model_cached
+
+        get_model_cached.cache_clear()
+        self.assertIs(get_model_cached("test_app.SampleModel"), SampleModel)
+        self.assertIs(get_model_cached("test_app", "samplemodel"), SampleModel)
+        self.assertIs(get_model_cached("test_app.SampleModel"), SampleModel)
+        self.assertEqual(get_model_cached.cache_info().hits, 1)
+
+        class_prepared.send(sender=SampleModel)
+        self.assertEqual(get_model_cached.cache_info().currsize, 0)
+
+
+class ValidateAndAuthorizeFilterTests(TestCase):
+    def setUp(self):
+        self.user = Mock(is_authenticated=True, pk=1, roles=["admin"])
+
+    def test_returns_path_lookup_and_permission(self):
+        from turbodrf.validation import validate_and_authorize_filter
+
+        self.assertEqual(
+            validate_and_authorize_filter(
+                SampleModel, "related__name__icontains", self.user
+            ),
+            ("related__name", "icontains", True),
+        )
+
+    def test_supplied_snapshot_used_for_root_model(self):
+        from unittest.mock import patch
+
+        from turbodrf.backends import PermissionSnapshot
+        from turbodrf.validation import validate_and_authorize_filter
+
+        denied = PermissionSnapshot()
+        with patch("turbodrf.backends.build_permission_snapshot") as build:
+            result = validate_and_authorize_filter(
+                SampleModel, "related__name", self.user, snapshot=denied
+            )
+
+        self.assertEqual(result, ("related__name", "exact", False))
+        build.assert_not_called()
+
+    def test_untraversable_path_denied(self):
+        from turbodrf.validation import validate_and_authorize_filter
+
+        self.assertEqual(
+            validate_and_authorize_filter(SampleModel, "title__name__gte", self.user),
+            ("title__name", "gte", False),
+        )
+
+    @override_settings(TURBODRF_MAX_NESTING_DEPTH=1)
+    def test_depth_limit_raises(self):
+        from django.core.exceptions import ValidationError
+
+        from turbodrf.validation import validate_and_authorize_filter
+
+        with self.assertRaises(ValidationError):
+            validate_and_authorize_filter(
+                SampleModel, "related__test_models__title", self.user
+            )
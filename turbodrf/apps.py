@@ -15,6 +15,71 @@ class TurboDRFConfig(AppConfig):
         if getattr(settings, "TURBODRF_ENABLE_DOCS", True):
             self._ensure_drf_yasg_installed()
 
+        self._connect_snapshot_invalidation()
+        self._connect_role_graph_invalidation()
+        self._connect_field_path_invalidation()
+
+    def _connect_field_path_invalidation(self):
+        """
+        Drop cached ``__``-path resolutions when a model is loaded late
+        (reverse relations on existing models change).
+        """
+        from django.db.models.signals import class_prepared
+
+        from .validation import clear_field_path_caches
+
+        class_prepared.connect(
+            clear_field_path_caches, dispatch_uid="turbodrf_field_path_caches"
+        )
+
+    def _connect_role_graph_invalidation(self):
+        """
+        Invalidate permission snapshots whenever a role, role permission or
+        user-role row is saved or deleted. Signals (not ``save()`` /
+        ``delete()`` overrides) so ``QuerySet.delete()`` and cascade deletes
+        are covered too: a ``RolePermission`` change bumps its role's
+        version (a new cache key in every process), and any change drops
+        this process's local snapshots.
+        """
+        from django.db.models.signals import post_delete, post_save
+
+        from .backends import bump_role_version, clear_local_snapshot_cache
+        from .models import RolePermission, TurboDRFRole, UserRole
+
+        for signal, name in ((post_save, "save"), (post_delete, "delete")):
+            signal.connect(
+                bump_role_version,
+                sender=RolePermission,
+                dispatch_uid=f"turbodrf_role_version_{name}_RolePermission",
+            )
+            for model in (TurboDRFRole, RolePermission, UserRole):
+                signal.connect(
+                    clear_local_snapshot_cache,
+                    sender=model,
+                    dispatch_uid=f"turbodrf_local_snapshots_{name}_{model.__name__}",
+                )
+
+    def _connect_snapshot_invalidation(self):
+        """
+        Drop process-local permission snapshots when TurboDRF settings
+        change (override_settings in tests, runtime settings mutation).
+        Role-graph changes clear it from the role models' post_save /
+        post_delete receivers (see ``_connect_role_graph_invalidation``).
+        """
+        from django.core.signals import setting_changed
+
+        from .backends import clear_local_snapshot_cache
+
+        def _on_setting_changed(setting, **kwargs):
+            if setting.startswith("TURBODRF_") or setting == "CACHES":
+                clear_local_snapshot_cache()
+
+        setting_changed.connect(
+            _on_setting_changed,
+            weak=False,
+            dispatch_uid="turbodrf_snapshot_setting_changed",
+        )
+
     def _ensure_drf_yasg_installed(self):
         """
         Ensure drf_yasg is in INSTALLED_APPS for template loading.
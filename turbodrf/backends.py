@@ -6,28 +6,63 @@ policy snapshots once per request and caching them for reuse.
 """
 
 import hashlib
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Optional, Set
+from typing import FrozenSet, Optional, Tuple
 
 from django.conf import settings
-from django.core.cache import cache
-
-
-@dataclass
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+
+# Process-local snapshot layer in front of Django's cache. Keyed on the SAME
+# key as the shared cache (user pk + the user's roles + role versions /
+# TURBODRF_ROLES signature), so a hit here is exactly as fresh as a shared-
+# cache hit — it only skips the backend round-trip and unpickle. Entries
+# honour TURBODRF_PERMISSION_CACHE_TIMEOUT and are dropped wholesale when
+# the role graph changes in-process (see clear_local_snapshot_cache). Off
+# when the default cache is DummyCache, which projects use to turn
+# permission caching off.
+_local_snapshots: "OrderedDict[str, Tuple[Optional[float], PermissionSnapshot]]" = (
+    OrderedDict()
+)
+_local_snapshots_lock = threading.Lock()
+
+# Pickle layout of PermissionSnapshot, part of every cache key. Bump it
+# whenever the class's pickled form changes (the slotted dataclass pickles as
+# a field tuple, not a __dict__), so old and new workers sharing one cache
+# during a rolling deploy never unpickle each other's entries.
+SNAPSHOT_FORMAT_VERSION = 2
+
+_SNAPSHOT_SET_FIELDS = (
+    "allowed_actions",
+    "readable_fields",
+    "writable_fields",
+    "fields_with_read_rules",
+    "fields_with_write_rules",
+)
+
+
+@dataclass(slots=True, frozen=True)
 class PermissionSnapshot:
     """
     A snapshot of effective permissions for a user on a specific model.
 
     This dataclass provides O(1) permission checking using set membership.
-    All permission checks are reduced to simple set lookups.
+    All permission checks are reduced to simple set lookups. It is slotted
+    (no per-instance ``__dict__`` — thousands of these sit in the local and
+    shared caches) and frozen: builders assemble the sets first and construct
+    the snapshot once. Containers are stored as frozensets (plain sets passed
+    in are converted), so a snapshot is immutable and hashable.
 
     Attributes:
-        allowed_actions: Set of allowed model actions
+        allowed_actions: Frozenset of allowed model actions
             ('read', 'create', 'update', 'delete')
-        readable_fields: Set of field names the user can read
-        writable_fields: Set of field names the user can write
-        fields_with_read_rules: Set of fields that have explicit read rules
-        fields_with_write_rules: Set of fields that have explicit write rules
+        readable_fields: Frozenset of field names the user can read
+        writable_fields: Frozenset of field names the user can write
+        fields_with_read_rules: Frozenset of fields that have explicit read rules
+        fields_with_write_rules: Frozenset of fields that have explicit write rules
 
     Example:
         snapshot = PermissionSnapshot(
@@ -44,11 +79,17 @@ class PermissionSnapshot:
         can_write_title = 'title' in snapshot.writable_fields
     """
 
-    allowed_actions: Set[str] = field(default_factory=set)
-    readable_fields: Set[str] = field(default_factory=set)
-    writable_fields: Set[str] = field(default_factory=set)
-    fields_with_read_rules: Set[str] = field(default_factory=set)
-    fields_with_write_rules: Set[str] = field(default_factory=set)
+    allowed_actions: FrozenSet[str] = field(default_factory=frozenset)
+    readable_fields: FrozenSet[str] = field(default_factory=frozenset)
+    writable_fields: FrozenSet[str] = field(default_factory=frozenset)
+    fields_with_read_rules: FrozenSet[str] = field(default_factory=frozenset)
+    fields_with_write_rules: FrozenSet[str] = field(default_factory=frozenset)
+
+    def __post_init__(self):
+        for name in _SNAPSHOT_SET_FIELDS:
+            value = getattr(self, name)
+            if type(value) is not frozenset:
+                object.__setattr__(self, name, frozenset(value))
 
     def can_perform_action(self, action: str) -> bool:
         """Check if user can perform a model-level action."""
@@ -62,6 +103,20 @@ class PermissionSnapshot:
         """Check if user can write a specific field."""
         return field_name in self.writable_fields
 
+    def can_read_path_field(self, field_name: str) -> bool:
+        """Check read access to one hop of a ``__``-path.
+
+        ``readable_fields`` already holds the merged rule/model-level decision
+        for concrete and M2M fields, so the common case is a single lookup.
+        Names it doesn't enumerate (reverse relations) fall back to the
+        explicit read rule, else the model-level ``read`` action.
+        """
+        if field_name in self.readable_fields:
+            return True
+        if field_name in self.fields_with_read_rules:
+            return False
+        return "read" in self.allowed_actions
+
     def has_read_rule(self, field_name: str) -> bool:
         """Check if field has explicit read permission rule."""
         return field_name in self.fields_with_read_rules
@@ -150,7 +205,6 @@ def build_permission_snapshot_static(user, model) -> PermissionSnapshot:
 
     TURBODRF_ROLES = getattr(settings, "TURBODRF_ROLES", default_roles)
 
-    snapshot = PermissionSnapshot()
     app_label = model._meta.app_label
     model_name = model._meta.model_name
 
@@ -176,14 +230,11 @@ def build_permission_snapshot_static(user, model) -> PermissionSnapshot:
                     all_field_write_rules.add(field_name)
 
     # Build allowed actions
+    allowed_actions = set()
     for action in ["read", "create", "update", "delete"]:
         perm = f"{app_label}.{model_name}.{action}"
         if perm in user_permissions:
-            snapshot.allowed_actions.add(action)
-
-    # Store fields with explicit rules
-    snapshot.fields_with_read_rules = all_field_read_rules
-    snapshot.fields_with_write_rules = all_field_write_rules
+            allowed_actions.add(action)
 
     # Build readable/writable fields
     # Get all model fields (including M2M fields)
@@ -195,31 +246,36 @@ def build_permission_snapshot_static(user, model) -> PermissionSnapshot:
         # Mock model without proper _meta - use empty set
         all_model_fields = set()
 
+    readable_fields = set()
+    writable_fields = set()
     for field_name in all_model_fields:
         # Check readable: if explicit read rule exists, check it; else use model-level
         if field_name in all_field_read_rules:
             field_perm = f"{app_label}.{model_name}.{field_name}.read"
             if field_perm in user_permissions:
-                snapshot.readable_fields.add(field_name)
+                readable_fields.add(field_name)
         else:
             # No explicit read rule, fall back to model-level permission
-            if "read" in snapshot.allowed_actions:
-                snapshot.readable_fields.add(field_name)
+            if "read" in allowed_actions:
+                readable_fields.add(field_name)
 
         # Check writable: if explicit write rule exists, check it; else use model-level
         if field_name in all_field_write_rules:
             field_perm = f"{app_label}.{model_name}.{field_name}.write"
             if field_perm in user_permissions:
-                snapshot.writable_fields.add(field_name)
+                writable_fields.add(field_name)
         else:
             # No explicit write rule, fall back to model-level permission
-            if (
-                "create" in snapshot.allowed_actions
-                or "update" in snapshot.allowed_actions
-            ):
-                snapshot.writable_fields.add(field_name)
-
-    return snapshot
+            if "create" in allowed_actions or "update" in allowed_actions:
+                writable_fields.add(field_name)
+
+    return PermissionSnapshot(
+        allowed_actions=frozenset(allowed_actions),
+        readable_fields=frozenset(readable_fields),
+        writable_fields=frozenset(writable_fields),
+        fields_with_read_rules=frozenset(all_field_read_rules),
+        fields_with_write_rules=frozenset(all_field_write_rules),
+    )
 
 
 def build_permission_snapshot_database(user, model) -> PermissionSnapshot:
@@ -236,50 +292,47 @@ def build_permission_snapshot_database(user, model) -> PermissionSnapshot:
     Returns:
         PermissionSnapshot: Computed permission snapshot
     """
-    from .models import RolePermission, TurboDRFRole
+    from .models import RolePermission
 
-    snapshot = PermissionSnapshot()
     app_label = model._meta.app_label
     model_name = model._meta.model_name
 
-    # Get user's roles
-    user_roles = get_user_roles(user)
-    if not user_roles:
-        return snapshot
-
-    # Query all permissions for this user's roles and this model
-    # Single database query for all permissions
-
-    role_ids = TurboDRFRole.objects.filter(name__in=user_roles).values_list(
-        "id", flat=True
-    )
+    # Every permission row for this user's roles on this model in ONE query:
+    # RolePermission JOIN UserRole on role, instead of resolving role names,
+    # then role ids, then permissions. Mirrors get_user_roles(): anonymous
+    # callers get the 'guest' role (no rows if it doesn't exist), an
+    # authenticated user without a pk has no roles.
+    if not user or not user.is_authenticated:
+        role_filter = {"role__name": "guest"}
+    else:
+        user_pk = getattr(user, "pk", None)
+        if user_pk is None:
+            return PermissionSnapshot()
+        role_filter = {"role__user_assignments__user_id": user_pk}
 
     permissions = RolePermission.objects.filter(
-        role_id__in=role_ids, app_label=app_label, model_name=model_name
-    ).select_related("role")
+        app_label=app_label, model_name=model_name, **role_filter
+    ).values_list("action", "field_name", "permission_type")
 
     # Track which fields have explicit rules (scan all permissions once)
     all_field_read_rules = set()
     all_field_write_rules = set()
 
     # First pass: collect model-level permissions and field rules
+    allowed_actions = set()
     user_field_perms = set()
-    for perm in permissions:
-        if perm.action:
+    for action, field_name, permission_type in permissions:
+        if action:
             # Model-level permission
-            snapshot.allowed_actions.add(perm.action)
-        elif perm.field_name and perm.permission_type:
+            allowed_actions.add(action)
+        elif field_name and permission_type:
             # Field-level permission
-            if perm.permission_type == "read":
-                all_field_read_rules.add(perm.field_name)
-                user_field_perms.add(f"{perm.field_name}.read")
-            elif perm.permission_type == "write":
-                all_field_write_rules.add(perm.field_name)
-                user_field_perms.add(f"{perm.field_name}.write")
-
-    # Store fields with explicit rules
-    snapshot.fields_with_read_rules = all_field_read_rules
-    snapshot.fields_with_write_rules = all_field_write_rules
+            if permission_type == "read":
+                all_field_read_rules.add(field_name)
+                user_field_perms.add(f"{field_name}.read")
+            elif permission_type == "write":
+                all_field_write_rules.add(field_name)
+                user_field_perms.add(f"{field_name}.write")
 
     # Second pass: build readable/writable fields
     try:
@@ -291,29 +344,34 @@ def build_permission_snapshot_database(user, model) -> PermissionSnapshot:
         # Mock model without proper _meta - use empty set
         all_model_fields = set()
 
+    readable_fields = set()
+    writable_fields = set()
     for field_name in all_model_fields:
         # Check readable: if explicit read rule exists, check it; else use model-level
         if field_name in all_field_read_rules:
             if f"{field_name}.read" in user_field_perms:
-                snapshot.readable_fields.add(field_name)
+                readable_fields.add(field_name)
         else:
             # No explicit read rule, fall back to model-level permission
-            if "read" in snapshot.allowed_actions:
-                snapshot.readable_fields.add(field_name)
+            if "read" in allowed_actions:
+                readable_fields.add(field_name)
 
         # Check writable: if explicit write rule exists, check it; else use model-level
         if field_name in all_field_write_rules:
             if f"{field_name}.write" in user_field_perms:
-                snapshot.writable_fields.add(field_name)
+                writable_fields.add(field_name)
         else:
             # No explicit write rule, fall back to model-level permission
-            if (
-                "create" in snapshot.allowed_actions
-                or "update" in snapshot.allowed_actions
-            ):
-                snapshot.writable_fields.add(field_name)
-
-    return snapshot
+            if "create" in allowed_actions or "update" in allowed_actions:
+                writable_fields.add(field_name)
+
+    return PermissionSnapshot(
+        allowed_actions=frozenset(allowed_actions),
+        readable_fields=frozenset(readable_fields),
+        writable_fields=frozenset(writable_fields),
+        fields_with_read_rules=frozenset(all_field_read_rules),
+        fields_with_write_rules=frozenset(all_field_write_rules),
+    )
 
 
 def get_cache_key(user, model) -> Optional[str]:
@@ -398,7 +456,83 @@ def get_cache_key(user, model) -> Optional[str]:
         repr((tuple(sorted(user_roles)), sig)).encode("utf-8")
     ).hexdigest()[:16]
 
-    return f"{cache_prefix}:{user_id}:{app_label}:{model_name}:{version_hash}"
+    return (
+        f"{cache_prefix}:v{SNAPSHOT_FORMAT_VERSION}:"
+        f"{user_id}:{app_label}:{model_name}:{version_hash}"
+    )
+
+
+def _get_cache_timeout():
+    return getattr(
+        settings, "TURBODRF_PERMISSION_CACHE_TIMEOUT", 300
+    )  # 5 minutes default
+
+
+def _get_local_snapshot(cache_key) -> Optional[PermissionSnapshot]:
+    with _local_snapshots_lock:
+        entry = _local_snapshots.get(cache_key)
+        if entry is None:
+            return None
+        expires_at, snapshot = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del _local_snapshots[cache_key]
+            return None
+        _local_snapshots.move_to_end(cache_key)
+        return snapshot
+
+
+def _local_cache_enabled() -> bool:
+    return not isinstance(caches["default"], DummyCache)
+
+
+def _set_local_snapshot(cache_key, snapshot: PermissionSnapshot):
+    max_size = getattr(settings, "TURBODRF_PERMISSION_LOCAL_CACHE_SIZE", 4096)
+    timeout = _get_cache_timeout()
+    if not max_size or timeout == 0:
+        return
+    # Django semantics: timeout=None caches forever
+    expires_at = None if timeout is None else time.monotonic() + timeout
+    with _local_snapshots_lock:
+        _local_snapshots[cache_key] = (expires_at, snapshot)
+        _local_snapshots.move_to_end(cache_key)
+        while len(_local_snapshots) > max_size:
+            _local_snapshots.popitem(last=False)
+
+
+def clear_local_snapshot_cache(**kwargs):
+    """
+    Drop every snapshot held in this process's local cache layer.
+
+    Connected to ``post_save`` / ``post_delete`` of ``TurboDRFRole``,
+    ``RolePermission`` and ``UserRole`` and called on ``setting_changed``
+    (see ``TurboDRFConfig.ready``). Role mutations are rare, so clearing
+    everything is cheaper than tracking which users a change touched.
+    Changes made by other processes are already picked up through the
+    cache key (role versions) or expire with the TTL.
+    """
+    with _local_snapshots_lock:
+        _local_snapshots.clear()
+
+
+def bump_role_version(sender, instance, **kwargs):
+    """
+    Bump the version of the role a ``RolePermission`` belongs to.
+
+    Connected to ``post_save`` / ``post_delete`` of ``RolePermission`` (see
+    ``TurboDRFConfig.ready``), so ``QuerySet.delete()`` and cascades move
+    every process — and the shared cache — to a new key, not just this
+    process's local layer. ``QuerySet.update()`` and ``bulk_create()`` send
+    no signals and still need the caches cleared by hand.
+    """
+    from django.db.models import F
+    from django.db.models.functions import Now
+
+    from .models import TurboDRFRole
+
+    if instance.role_id:
+        TurboDRFRole.objects.filter(pk=instance.role_id).update(
+            version=F("version") + 1, updated_at=Now()
+        )
 
 
 def get_cached_snapshot(user, model) -> Optional[PermissionSnapshot]:
@@ -432,10 +566,7 @@ def set_cached_snapshot(user, model, snapshot: PermissionSnapshot):
         # Uncacheable identity (authenticated, no pk) — never persist a
         # snapshot under a shared key.
         return
-    cache_timeout = getattr(
-        settings, "TURBODRF_PERMISSION_CACHE_TIMEOUT", 300
-    )  # 5 minutes default
-    cache.set(cache_key, snapshot, cache_timeout)
+    cache.set(cache_key, snapshot, _get_cache_timeout())
 
 
 def build_permission_snapshot(user, model, use_cache=True) -> PermissionSnapshot:
@@ -460,10 +591,20 @@ def build_permission_snapshot(user, model, use_cache=True) -> PermissionSnapshot
             # User can read articles
             pass
     """
-    # Try cache first
-    if use_cache:
-        cached = get_cached_snapshot(user, model)
+    # Compute the key once — in database mode it costs a query
+    cache_key = get_cache_key(user, model) if use_cache else None
+
+    use_local = cache_key is not None and _local_cache_enabled()
+
+    # Try the process-local layer, then the shared cache
+    if cache_key is not None:
+        cached = _get_local_snapshot(cache_key) if use_local else None
+        if cached is not None:
+            return cached
+        cached = cache.get(cache_key)
         if cached is not None:
+            if use_local:
+                _set_local_snapshot(cache_key, cached)
             return cached
 
     # Build snapshot based on permission mode
@@ -475,9 +616,11 @@ def build_permission_snapshot(user, model, use_cache=True) -> PermissionSnapshot
         # static mode (or fallback)
         snapshot = build_permission_snapshot_static(user, model)
 
-    # Cache the result
-    if use_cache:
-        set_cached_snapshot(user, model, snapshot)
+    # Cache the result (key is None for uncacheable identities)
+    if cache_key is not None:
+        cache.set(cache_key, snapshot, _get_cache_timeout())
+        if use_local:
+            _set_local_snapshot(cache_key, snapshot)
 
     return snapshot
 
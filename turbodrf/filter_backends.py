@@ -6,12 +6,126 @@ django-filter provides out of the box.
 """
 
 import logging
+from functools import lru_cache
 
+from django.core.exceptions import FieldDoesNotExist, FieldError, ValidationError
 from django.db.models import Q
 from rest_framework.filters import BaseFilterBackend, SearchFilter
 
 logger = logging.getLogger(__name__)
 
+# Query params consumed by pagination / search / ordering / rendering, never
+# treated as filters. Only the page-number defaults: cursor / limit / offset
+# (and any customised names) are skipped when _view_skip() finds a paginator
+# or filter backend on the view that actually reads them.
+_DEFAULT_SKIP = frozenset(("page", "page_size", "search", "ordering", "format"))
+
+# Class attributes naming the query params a paginator / filter backend reads
+_PARAM_ATTRS = (
+    "page_query_param",
+    "page_size_query_param",
+    "limit_query_param",
+    "offset_query_param",
+    "cursor_query_param",
+    "search_param",
+    "ordering_param",
+)
+
+# Raised by .filter() when a value can't be prepared for its field/lookup
+# (e.g. "abc" for an IntegerField, an unsupported lookup name).
+_FILTER_VALUE_ERRORS = (
+    FieldDoesNotExist,
+    FieldError,
+    ValidationError,
+    ValueError,
+    TypeError,
+)
+
+
+def _expand_filterset_fields(filterset_fields):
+    """Flatten a ``filterset_fields`` list/dict into names + ``name__lookup``."""
+    names = set()
+    if isinstance(filterset_fields, dict):
+        for field_name, lookups in filterset_fields.items():
+            names.add(field_name)
+            for lookup in lookups:
+                names.add(f"{field_name}__{lookup}")
+    elif isinstance(filterset_fields, (list, tuple)):
+        names.update(filterset_fields)
+    return names
+
+
+@lru_cache(maxsize=256)
+def _allowed_filters(view_cls, model):
+    """Filter-name allow-list for ``view_cls`` over ``model``, built once.
+
+    Covers the model's concrete + M2M field names and a STATIC
+    ``filterset_fields`` declared on the class. A property / callable
+    ``filterset_fields`` (TurboDRFViewSet's narrows by the caller's readable
+    fields) is per-request by construction and is never folded in here — see
+    :func:`_has_dynamic_filterset_fields`.
+    """
+    names = {field.name for field in model._meta.fields}
+    names.update(field.name for field in model._meta.many_to_many)
+    declared = getattr(view_cls, "filterset_fields", None)
+    if isinstance(declared, (list, tuple, dict)):
+        names |= _expand_filterset_fields(declared)
+    return frozenset(names)
+
+
+@lru_cache(maxsize=256)
+def _view_skip(view_cls):
+    """
+    Skip set for ``view_cls``: the defaults plus whatever param names its
+    pagination class and filter backends actually read (e.g. a paginator
+    with ``page_query_param = "p"``), so those never reach filter parsing.
+    """
+    sources = [getattr(view_cls, "pagination_class", None)]
+    sources.extend(getattr(view_cls, "filter_backends", None) or ())
+    names = set()
+    for source in sources:
+        for attr in _PARAM_ATTRS:
+            name = getattr(source, attr, None)
+            if isinstance(name, str) and name:
+                names.add(name)
+    return _DEFAULT_SKIP | names
+
+
+def _has_dynamic_filterset_fields(view_cls):
+    """True if a name missing from the cached allow-list must be checked
+    against the view's per-request ``filterset_fields``.
+
+    A view whose dynamic set only ever narrows the model's own fields sets
+    ``filterset_fields_within_model = True`` (TurboDRFViewSet does); a miss
+    there is dropped without resolving it. The flag only vouches for the
+    class that sets it: a subclass overriding ``filterset_fields`` /
+    ``get_filterset_fields`` (e.g. to add annotations) is resolved again
+    unless it sets the flag itself.
+    """
+    owner = next(
+        (
+            klass
+            for klass in view_cls.__mro__
+            if "filterset_fields_within_model" in vars(klass)
+        ),
+        None,
+    )
+    if owner is not None and vars(owner)["filterset_fields_within_model"]:
+        if all(
+            getattr(view_cls, name, None) is getattr(owner, name, None)
+            for name in ("filterset_fields", "get_filterset_fields")
+        ):
+            return False
+    declared = getattr(view_cls, "filterset_fields", None)
+    return declared is not None and not isinstance(declared, (list, tuple, dict))
+
+
+def _in_allow_list(field_name, valid_fields):
+    """Same name check as :meth:`ORFilterBackend._is_valid_filter_field`."""
+    if field_name in valid_fields:
+        return True
+    return "__" in field_name and field_name.split("__", 1)[0] in valid_fields
+
 
 class TurboDRFSearchFilter(SearchFilter):
     """SearchFilter that caps the length of each ``?search=`` term.
@@ -57,6 +171,14 @@ class ORFilterBackend(BaseFilterBackend):
         - Different '_or' groups are combined with AND logic
         - Regular parameters (without '_or') are combined with AND logic
         - All lookups supported by Django are supported (e.g., __icontains, __gte, etc.)
+        - A value the field can't accept (e.g. ``?related_or=abc``) is dropped
+          from its '_or' group; a group left with no usable value matches
+          nothing rather than being ignored
+        - Row-level access (tenant boundary + predicates) is already part of
+          the queryset this backend receives (``TurboDRFViewSet.get_queryset``
+          applies ``authorize(request).scope()``), so the fused filter lands in
+          the same SQL WHERE and pagination ``COUNT(*)`` only sees readable
+          rows; ``__``-traversals are additionally scoped per target here
 
     Example:
         # Find users with name containing 'John' OR 'Jane'
@@ -78,16 +200,38 @@ class ORFilterBackend(BaseFilterBackend):
         Returns:
             QuerySet: The filtered queryset with OR logic applied.
         """
-        # Get valid filterable fields from the view
-        valid_fields = self._get_valid_filter_fields(view, queryset.model)
+        # Handle both DRF Request (query_params) and Django Request (GET)
+        query_dict = getattr(request, "query_params", request.GET)
+        if not query_dict:
+            # Most list requests carry no params at all
+            return queryset
+
+        # Allow-list of filterable names, cached per (view class, model) so
+        # unknown params (crawlers, fuzzers) are dropped with a set lookup
+        # instead of a permission walk + ORM resolution.
+        view_cls = type(view)
+        allowed = _allowed_filters(view_cls, queryset.model)
+        skip = _view_skip(view_cls)
+        # A per-request filterset_fields is only resolved when a key misses
+        # the cached allow-list.
+        dynamic_allowed = None
+
+        def _valid_fields_for(name):
+            nonlocal dynamic_allowed
+            if _in_allow_list(name, allowed):
+                return allowed
+            if not _has_dynamic_filterset_fields(view_cls):
+                return None
+            if dynamic_allowed is None:
+                dynamic_allowed = allowed | frozenset(
+                    self._get_valid_filter_fields(view, queryset.model)
+                )
+            return dynamic_allowed if _in_allow_list(name, dynamic_allowed) else None
 
         # Get all query parameters ending with '_or'
         or_params = {}
         regular_params = {}
 
-        # Handle both DRF Request (query_params) and Django Request (GET)
-        query_dict = getattr(request, "query_params", request.GET)
-
         # Bound filter value length. Beyond this, SQLite raises "LIKE
         # pattern too complex" and Postgres burns CPU O(N×len) — both DoS
         # vectors. 1000 covers normal use (UUIDs, long titles, multi-word
@@ -97,12 +241,14 @@ class ORFilterBackend(BaseFilterBackend):
 
         max_filter_value_len = getattr(_s, "TURBODRF_MAX_FILTER_VALUE_LENGTH", 1000)
 
-        for key in query_dict.keys():
+        # One pass over (key, [values]) pairs — no per-key getlist()/get()
+        # re-lookups into the QueryDict.
+        for key, values in query_dict.lists():
             # Skip pagination and other special parameters
-            if key in ["page", "page_size", "search", "ordering", "format"]:
+            if key in skip:
                 continue
             # Reject excessively long filter values (DoS guard).
-            for v in query_dict.getlist(key):
+            for v in values:
                 if v is not None and len(str(v)) > max_filter_value_len:
                     return queryset.none()
 
@@ -111,7 +257,8 @@ class ORFilterBackend(BaseFilterBackend):
                 field_name = key[:-3]
 
                 # Validate field name against valid fields AND permissions
-                if not self._is_valid_filter_field(
+                valid_fields = _valid_fields_for(field_name)
+                if valid_fields is None or not self._is_valid_filter_field(
                     field_name, valid_fields, queryset.model, request.user
                 ):
                     # Silent drop (intentional — noisy 400s leak the field
@@ -125,15 +272,17 @@ class ORFilterBackend(BaseFilterBackend):
                     )
                     continue
 
-                # Get all values for this parameter (handles multiple values)
-                values = query_dict.getlist(key)
+                # The QueryDict's own list — kept as-is (no getlist() copy
+                # or list() rewrap) all the way into the __in lookup.
                 or_params[field_name] = values
             else:
                 # Validate regular filter fields AND permissions
-                if self._is_valid_filter_field(
+                valid_fields = _valid_fields_for(key)
+                if valid_fields is not None and self._is_valid_filter_field(
                     key, valid_fields, queryset.model, request.user
                 ):
-                    regular_params[key] = query_dict.get(key)
+                    # Last value wins, matching QueryDict.get()
+                    regular_params[key] = values[-1]
                 else:
                     logger.info(
                         "turbodrf.filter.dropped: %s (invalid or "
@@ -142,6 +291,11 @@ class ORFilterBackend(BaseFilterBackend):
                         queryset.model.__name__,
                     )
 
+        if not or_params and not regular_params:
+            # Only pagination/search/ordering params, or everything dropped:
+            # no scoping or Q building needed.
+            return queryset
+
         # Traversal scoping: for `__`-paths to a target with registered
         # predicates / tenant_field, the JOIN must be scoped to rows the
         # caller can see via the target's own endpoint. Otherwise
@@ -166,44 +320,142 @@ class ORFilterBackend(BaseFilterBackend):
                 return Q()
             return build_traversal_scope_q(queryset.model, field_path, request)
 
-        # Build OR queries
-        if or_params:
-            q_objects = Q()
-            for field_name, values in or_params.items():
-                # Create OR condition for all values of this field
-                field_q = Q()
-                for value in values:
-                    field_q |= Q(**{field_name: value})
-                # AND in target scoping for this OR-group's path
-                field_q &= _scope_path(field_name)
-                # Combine with AND between different fields
-                q_objects &= field_q
-
-            queryset = queryset.filter(q_objects)
-
-        # Apply regular filters (these use AND logic)
+        # Fuse every predicate into ONE Q and apply it with a single
+        # .filter() call — each .filter() clones the queryset and rebuilds
+        # the Query tree, so per-param calls cost O(n_params) clones for the
+        # same AND-of-ORs SQL.
+        fused = []
+
+        # OR groups: values of one group OR'd, groups AND'd together. With
+        # no `_or` params (the common case) this is skipped entirely and
+        # only the AND path below runs.
+        # Kept apart so the fallback below can rebuild a group from only
+        # the values its field accepts.
+        or_groups = []
+        for field_name, values in or_params.items():
+            # AND in target scoping for this OR-group's path
+            scope_q = _scope_path(field_name)
+            or_groups.append((field_name, values, scope_q))
+            fused.append(self._or_group_q(queryset.model, field_name, values) & scope_q)
+
+        # Regular filters (these use AND logic). A param spanning a
+        # multi-valued relation keeps its own .filter() call: Django binds
+        # conditions in one call to the SAME related row, so fusing
+        # `?tags__name=a&tags__slug=b` would silently narrow the result.
+        separate = []
         for key, value in regular_params.items():
+            # Handle __in lookups specially
+            if "__in" in key:
+                value = value.split(",")
+            # Coerce isnull values to bool — Django's ORM rejects
+            # strings here, so a malformed `?x__isnull=garbage` raises
+            # at SQL-build time and surfaces as a 500.
+            elif key.endswith("__isnull"):
+                coerced = self._parse_bool(value)
+                if coerced is None:
+                    continue  # silently drop malformed isnull values
+                value = coerced
+
+            param_q = Q(**{key: value}) & _scope_path(key)
+            if self._spans_multi_valued(queryset.model, key):
+                separate.append(param_q)
+            else:
+                fused.append(param_q)
+
+        if not fused and not separate:
+            return queryset
+
+        try:
+            filtered = queryset
+            if fused:
+                combined = Q()
+                for param_q in fused:
+                    combined &= param_q
+                filtered = filtered.filter(combined)
+            for param_q in separate:
+                filtered = filtered.filter(param_q)
+            return filtered
+        except _FILTER_VALUE_ERRORS:
+            # A value the field can't coerce (e.g. ?price=abc). Rare, so
+            # only now fall back to one .filter() per predicate and drop
+            # the ones that fail, as before.
+            pass
+
+        # An OR group keeps the values its field accepts. Dropping the whole
+        # group would widen the result past every value the caller asked
+        # for; with no usable value at all, the group matches nothing.
+        for field_name, values, scope_q in or_groups:
+            usable = [
+                value
+                for value in values
+                if self._accepts_value(queryset, field_name, value)
+            ]
+            if not usable:
+                logger.info(
+                    "turbodrf.filter.no_usable_values: %s_or on %s",
+                    field_name,
+                    queryset.model.__name__,
+                )
+                return queryset.none()
+            queryset = queryset.filter(
+                self._or_group_q(queryset.model, field_name, usable) & scope_q
+            )
+
+        for param_q in fused[len(or_groups) :] + separate:
             try:
-                # Handle __in lookups specially
-                if "__in" in key:
-                    value = value.split(",")
-                # Coerce isnull values to bool — Django's ORM rejects
-                # strings here, so a malformed `?x__isnull=garbage` raises
-                # at SQL-build time and surfaces as a 500.
-                elif key.endswith("__isnull"):
-                    coerced = self._parse_bool(value)
-                    if coerced is None:
-                        continue  # silently drop malformed isnull values
-                    value = coerced
-
-                queryset = queryset.filter(Q(**{key: value}) & _scope_path(key))
-            except (ValueError, TypeError, Exception):
-                # Skip filters that cause type conversion errors
-                # (e.g., "true" string for a BooleanField)
+                queryset = queryset.filter(param_q)
+            except _FILTER_VALUE_ERRORS:
                 continue
 
         return queryset
 
+    @classmethod
+    def _or_group_q(cls, model, field_name, values):
+        """One ``Q`` matching any of ``values`` on ``field_name``."""
+        in_key = cls._in_lookup_key(model, field_name)
+        if in_key is not None:
+            # Same-field equality OR-chain → one IN list: a single Q to
+            # build, and an index-friendly plan instead of N OR'd terms.
+            return Q(**{in_key: values})
+        # Non-exact lookups (e.g. __icontains_or) stay an OR-chain, built as
+        # one OR node from (lookup, value) children — no per-value kwargs
+        # dict, Q, or |= combine.
+        return Q(*((field_name, value) for value in values), _connector=Q.OR)
+
+    @staticmethod
+    def _accepts_value(queryset, lookup, value):
+        """True if ``lookup=value`` can be prepared for its field."""
+        try:
+            queryset.filter(**{lookup: value})
+        except _FILTER_VALUE_ERRORS:
+            return False
+        return True
+
+    @staticmethod
+    def _in_lookup_key(model, field_name):
+        """The ``__in`` key equivalent to OR-ing exact matches on
+        ``field_name``, or ``None`` when the lookup isn't a plain exact.
+
+        Only paths whose every segment resolves to a real model field
+        qualify — lookups, transforms and JSON key paths keep the OR-chain.
+        """
+        from .validation import get_nested_field_model
+
+        if field_name.endswith("__exact"):
+            field_name = field_name[: -len("__exact")]
+        try:
+            get_nested_field_model(model, field_name)
+        except FieldDoesNotExist:
+            return None
+        return f"{field_name}__in"
+
+    @staticmethod
+    def _spans_multi_valued(model, key):
+        """True if the ``__``-path in ``key`` crosses an M2M / reverse FK."""
+        from .validation import path_spans_multi_valued
+
+        return path_spans_multi_valued(model, key)
+
     @staticmethod
     def _parse_bool(value):
         """Coerce a string to a bool for __isnull lookups, or None if invalid."""
@@ -233,13 +485,7 @@ class ORFilterBackend(BaseFilterBackend):
                 filterset_fields = filterset_fields()
 
             # Add base field names and their lookups
-            if isinstance(filterset_fields, dict):
-                for field_name, lookups in filterset_fields.items():
-                    valid_fields.add(field_name)
-                    for lookup in lookups:
-                        valid_fields.add(f"{field_name}__{lookup}")
-            elif isinstance(filterset_fields, list):
-                valid_fields.update(filterset_fields)
+            valid_fields |= _expand_filterset_fields(filterset_fields)
 
         # Also allow direct model field names
         for field in model._meta.fields:
@@ -149,7 +149,8 @@ class Command(BaseCommand):
         self.stdout.write(
             f"\n  {self.style.NOTICE(f'Permission filtering (role: {role_name}):')}"
         )
-        self.stdout.write(f"    Actions: {snapshot.allowed_actions or 'none'}")
+        actions = ", ".join(sorted(snapshot.allowed_actions)) or "none"
+        self.stdout.write(f"    Actions: {actions}")
 
         if snapshot.readable_fields:
             # Show which fields survive
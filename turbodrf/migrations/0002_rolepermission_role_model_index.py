@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-14 19:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("turbodrf", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="rolepermission",
+            index=models.Index(
+                fields=["role", "app_label", "model_name"],
+                name="turbodrf_perm_role_model_idx",
+            ),
+        ),
+    ]
@@ -97,6 +97,8 @@ class RolePermission(models.Model):
     """A single permission granted to a `TurboDRFRole`. Supports model-level
     actions (read/create/update/delete) and field-level rules (read/write).
     The CheckConstraint enforces that exactly one form is set per row.
+    Saving or deleting a row bumps its role's `version` (a `post_save` /
+    `post_delete` receiver, see `turbodrf.backends.bump_role_version`).
     """
 
     # Permission types
@@ -174,6 +176,14 @@ class RolePermission(models.Model):
         verbose_name = "TurboDRF Permission"
         verbose_name_plural = "TurboDRF Permissions"
 
+        # Serves the snapshot builder's per-(role, model) permission lookup
+        indexes = [
+            models.Index(
+                fields=["role", "app_label", "model_name"],
+                name="turbodrf_perm_role_model_idx",
+            ),
+        ]
+
         # Ensure unique permissions per role
         constraints = [
             # Model-level permission uniqueness
@@ -218,26 +228,6 @@ class RolePermission(models.Model):
         else:
             return f"{self.app_label}.{self.model_name}.{self.action}"
 
-    def save(self, *args, **kwargs):
-        """Update role version on permission change for cache invalidation."""
-        super().save(*args, **kwargs)
-        # Increment role version to invalidate caches
-        if self.role:
-            TurboDRFRole.objects.filter(pk=self.role.pk).update(
-                version=models.F("version") + 1, updated_at=models.functions.Now()
-            )
-
-    def delete(self, *args, **kwargs):
-        """Update role version on permission deletion for cache invalidation."""
-        role_pk = self.role.pk if self.role else None
-        result = super().delete(*args, **kwargs)
-        # Increment role version to invalidate caches
-        if role_pk:
-            TurboDRFRole.objects.filter(pk=role_pk).update(
-                version=models.F("version") + 1, updated_at=models.functions.Now()
-            )
-        return result
-
 
 class UserRole(models.Model):
     """
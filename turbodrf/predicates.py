@@ -715,10 +715,11 @@ def validate_permission_strings():
     isn't loaded are skipped silently when
     ``TURBODRF_ALLOW_UNKNOWN_PERMISSIONS`` is set, otherwise they raise.
     """
-    from django.apps import apps
     from django.conf import settings as dj_settings
     from django.core.exceptions import ImproperlyConfigured
 
+    from .validation import get_model_cached
+
     allow_unknown = getattr(dj_settings, "TURBODRF_ALLOW_UNKNOWN_PERMISSIONS", False)
     roles = getattr(dj_settings, "TURBODRF_ROLES", None)
     if not roles:
@@ -736,7 +737,7 @@ def validate_permission_strings():
             return
         app_label, model_name = parts[0], parts[1]
         try:
-            model = apps.get_model(app_label, model_name)
+            model = get_model_cached(app_label, model_name)
         except LookupError:
             if allow_unknown:
                 return
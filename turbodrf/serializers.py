@@ -795,9 +795,9 @@ class TurboDRFSerializerFactory:
                     tenant_model_setting = getattr(_s, "TURBODRF_TENANT_MODEL", None)
                     if tenant_model_setting:
                         try:
-                            from django.apps import apps as _apps
+                            from .validation import get_model_cached
 
-                            tenant_model = _apps.get_model(tenant_model_setting)
+                            tenant_model = get_model_cached(tenant_model_setting)
                         except Exception:
                             tenant_model = None
 
@@ -900,25 +900,16 @@ class TurboDRFSerializerFactory:
         Returns:
             list: Filtered list of field names the user can read.
         """
-        from .validation import check_nested_field_permissions, validate_nesting_depth
+        from .validation import filter_visible_fields_many, validate_nesting_depth
 
-        permitted = []
-
-        # Get sensitive fields deny-list
+        candidates = []
 
         # First check if we should handle fields as "__all__"
         if fields == "__all__":
             # Get all model fields
             fields = [f.name for f in model._meta.fields]
 
-        from .validation import is_field_path_sensitive
-
         for field in fields:
-            # Strip sensitive fields at every segment of the path (I-2 fix).
-            if is_field_path_sensitive(field):
-                logger.debug(f"Stripping sensitive field '{field}'")
-                continue
-
             # Validate nesting depth
             try:
                 validate_nesting_depth(field)
@@ -927,11 +918,12 @@ class TurboDRFSerializerFactory:
                 logger.warning(f"Skipping field '{field}': {str(e)}")
                 continue
 
-            # Check nested permissions (traverses relationships)
-            if check_nested_field_permissions(model, field, user):
-                permitted.append(field)
+            candidates.append(field)
 
-        return permitted
+        # Strip sensitive fields at every segment of the path (I-2 fix) and
+        # check nested permissions in one batch, so shared prefixes and
+        # related-model snapshots are resolved once
+        return filter_visible_fields_many(model, candidates, user)
 
     @classmethod
     def _get_read_only_fields_with_snapshot(cls, model, fields, snapshot):
@@ -13,9 +13,10 @@ Two responsibilities:
 import difflib
 from collections import deque
 
-from django.apps import apps
 from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
 
+from .validation import get_model_cached
+
 
 class AmbiguousTenantPath(ImproperlyConfigured):
     """Raised when multiple FK paths from a model lead to the tenant model."""
@@ -27,7 +28,7 @@ def _resolve_tenant_model(tenant_model_setting):
         return None
     if isinstance(tenant_model_setting, str):
         try:
-            return apps.get_model(tenant_model_setting)
+            return get_model_cached(tenant_model_setting)
         except (LookupError, ValueError) as e:
             raise ImproperlyConfigured(
                 f"TURBODRF_TENANT_MODEL={tenant_model_setting!r} cannot be "
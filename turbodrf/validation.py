@@ -6,6 +6,7 @@ Django ORM relationships to check permissions at each level.
 """
 
 import logging
+from functools import lru_cache
 
 from django.conf import settings
 from django.core.exceptions import FieldDoesNotExist, ValidationError
@@ -98,6 +99,22 @@ def get_nested_field_model(model, field_path):
         >>> #   (Publisher, CharField, 'name')
         >>> # ])
     """
+    final_model, field_chain, error = _resolve_field_chain(model, field_path)
+    if error is not None:
+        raise FieldDoesNotExist(error)
+    return final_model, list(field_chain)
+
+
+@lru_cache(maxsize=8192)
+def _resolve_field_chain(model, field_path):
+    """Cached walk behind :func:`get_nested_field_model`.
+
+    Pure in ``(model, field_path)`` — model metadata doesn't change after
+    startup; :func:`clear_field_path_caches` handles late model loading.
+    Unresolvable paths are cached too (as an error message, with the chain
+    resolved up to the bad segment) so repeated bad filter params don't
+    re-walk ``_meta`` either.
+    """
     parts = field_path.split("__")
     field_chain = []
     current_model = model
@@ -105,18 +122,45 @@ def get_nested_field_model(model, field_path):
     for part in parts:
         try:
             field = current_model._meta.get_field(part)
-            field_chain.append((current_model, field, part))
-
-            # If this is a relational field, get the related model
-            if hasattr(field, "related_model") and field.related_model:
-                current_model = field.related_model
-            # For the final field, keep the current model
         except FieldDoesNotExist:
-            raise FieldDoesNotExist(
-                f"Field '{part}' does not exist on model {current_model.__name__}"
+            return (
+                None,
+                tuple(field_chain),
+                f"Field '{part}' does not exist on model {current_model.__name__}",
             )
+        field_chain.append((current_model, field, part))
 
-    return current_model, field_chain
+        # If this is a relational field, get the related model
+        if hasattr(field, "related_model") and field.related_model:
+            current_model = field.related_model
+        # For the final field, keep the current model
+
+    return current_model, tuple(field_chain), None
+
+
+@lru_cache(maxsize=256)
+def get_model_cached(app_label, model_name=None):
+    """Memoized ``apps.get_model``, shared by every TurboDRF model lookup.
+
+    ``apps.get_model`` re-checks registry readiness and re-splits / lowers
+    the label on every call. Lookup failures raise ``LookupError`` as
+    before and are not cached.
+    """
+    from django.apps import apps
+
+    return apps.get_model(app_label, model_name)
+
+
+def clear_field_path_caches(**kwargs):
+    """Drop cached ``__``-path resolutions and model lookups.
+
+    Connected to ``class_prepared`` (see ``TurboDRFConfig.ready``): a model
+    loaded after startup can add reverse relations to existing models.
+    """
+    get_model_cached.cache_clear()
+    _resolve_field_chain.cache_clear()
+    _permission_chain.cache_clear()
+    _split_filter_param.cache_clear()
 
 
 def validate_searchable_fields_safety(model):
@@ -238,6 +282,21 @@ def validate_searchable_fields_safety(model):
         raise ImproperlyConfigured(message)
 
 
+def path_spans_multi_valued(model, path):
+    """True if the ``__``-path (lookups allowed) crosses an M2M / reverse FK.
+
+    Walks the cached :func:`_resolve_field_chain` up to the lookup, or the
+    first non-relational field.
+    """
+    _final_model, hops, _error = _resolve_field_chain(model, path)
+    for _model, field, _part in hops:
+        if field.many_to_many or field.one_to_many:
+            return True
+        if not field.related_model:
+            return False
+    return False
+
+
 def path_traverses_predicate_target(parent_model, field_path):
     """True if the JOIN chain for ``field_path`` passes through a model
     with registered predicates or tenant-drift relative to the parent.
@@ -403,6 +462,45 @@ def scoped_target_queryset(target_model, request):
     return qs
 
 
+@lru_cache(maxsize=4096)
+def _permission_chain(model, field_path):
+    """
+    Resolve ``field_path`` into the ``(model, field_name)`` pairs whose read
+    permission must be checked, once per ``(model, field_path)``.
+
+    Built on :func:`_resolve_field_chain` for every segment but the last:
+    the final segment is never resolved (it is checked by permission only),
+    so a broken path always breaks mid-chain.
+
+    Returns:
+        tuple: (steps, broken) — ``broken`` is None for a traversable path,
+        else a reason string.
+    """
+    parts = field_path.split("__")
+    if len(parts) == 1:
+        return ((model, field_path),), None
+
+    final_model, hops, error = _resolve_field_chain(model, "__".join(parts[:-1]))
+    steps = []
+    for current_model, field, part in hops:
+        steps.append((current_model, part))
+        if not getattr(field, "related_model", None):
+            remaining_path = ".".join(parts[len(steps) :])
+            return tuple(steps), (
+                f"Field '{part}' on {current_model.__name__} is not a "
+                f"relational field, cannot traverse to '{remaining_path}'"
+            )
+
+    if error is not None:
+        # Every hop so far is relational; the next segment doesn't exist
+        current_model = hops[-1][1].related_model if hops else model
+        steps.append((current_model, parts[len(steps)]))
+        return tuple(steps), error
+
+    steps.append((final_model, parts[-1]))
+    return tuple(steps), None
+
+
 def check_nested_field_permissions(model, field_path, user, use_cache=True):
     """
     Check permissions for a nested field path using permission snapshots.
@@ -410,6 +508,11 @@ def check_nested_field_permissions(model, field_path, user, use_cache=True):
     This function traverses the relationship chain and checks read permissions
     at each level, building snapshots for related models as needed.
 
+    The chain itself is resolved once per ``(model, field_path)`` and cached,
+    so an untraversable path is rejected before any snapshot is built, and
+    each model's snapshot is built at most once per call (self-referential
+    chains like ``parent__parent__name``).
+
     Args:
         model: Starting Django model class
         field_path: Field path with __ notation
@@ -426,63 +529,86 @@ def check_nested_field_permissions(model, field_path, user, use_cache=True):
         3. Build Salary model snapshot, check Salary.amount permission
         Returns True only if ALL checks pass.
     """
-    from .backends import build_permission_snapshot
+    steps, broken = _permission_chain(model, field_path)
+    if broken is not None:
+        logger.warning(broken)
+        return False
 
-    # Simple field (no nesting) - check on base model
-    if "__" not in field_path:
-        snapshot = build_permission_snapshot(user, model, use_cache=use_cache)
-        base_field = field_path
-        if snapshot.has_read_rule(base_field):
-            return snapshot.can_read_field(base_field)
-        else:
-            return snapshot.can_perform_action("read")
+    return _authorize_chain(steps, user, {}, use_cache)
 
-    # Nested field - traverse and check permissions at each level
-    parts = field_path.split("__")
-    current_model = model
 
-    for i, part in enumerate(parts):
-        # Build snapshot for current model
-        current_snapshot = build_permission_snapshot(
-            user, current_model, use_cache=use_cache
+def check_nested_field_permissions_many(model, field_paths, user, use_cache=True):
+    """
+    Batch form of :func:`check_nested_field_permissions`.
+
+    Each model's snapshot is built at most once for the whole batch, and each
+    ``(model, field_name)`` step is decided once, so paths sharing a prefix
+    (``author__name``, ``author__publisher__name``) only walk it once.
+
+    Args:
+        model: Starting Django model class
+        field_paths: Iterable of field paths with __ notation
+        user: Django user object for permission checking
+        use_cache: Whether to use permission snapshot caching (default: True)
+
+    Returns:
+        dict: Maps each field path to True if the user can read it
+    """
+    snapshots = {}
+    decisions = {}
+    results = {}
+
+    for field_path in field_paths:
+        if field_path in results:
+            continue
+        steps, broken = _permission_chain(model, field_path)
+        if broken is not None:
+            logger.warning(broken)
+            results[field_path] = False
+            continue
+        results[field_path] = _authorize_chain(
+            steps, user, snapshots, use_cache, decisions
         )
 
+    return results
+
+
+def _authorize_chain(steps, user, snapshots, use_cache, decisions=None):
+    """
+    Check read permission on every ``(model, part)`` step, stopping at the
+    first denial. ``snapshots`` maps model -> snapshot and is filled lazily;
+    ``decisions``, if given, memoizes each step's outcome across calls.
+    """
+    from .backends import build_permission_snapshot
+
+    for step in steps:
+        if decisions is not None:
+            allowed = decisions.get(step)
+            if allowed is not None:
+                if not allowed:
+                    return False
+                continue
+
+        current_model, part = step
+        current_snapshot = snapshots.get(current_model)
+        if current_snapshot is None:
+            current_snapshot = build_permission_snapshot(
+                user, current_model, use_cache=use_cache
+            )
+            snapshots[current_model] = current_snapshot
+
         # Check permission for this field
+        allowed = current_snapshot.can_read_path_field(part)
+        if decisions is not None:
+            decisions[step] = allowed
+        if allowed:
+            continue
         if current_snapshot.has_read_rule(part):
-            if not current_snapshot.can_read_field(part):
-                logger.debug(
-                    f"Permission denied: {current_model.__name__}.{part} "
-                    f"(explicit read rule failed)"
-                )
-                return False
+            reason = "explicit read rule failed"
         else:
-            if not current_snapshot.can_perform_action("read"):
-                logger.debug(
-                    f"Permission denied: {current_model.__name__}.{part} "
-                    f"(model-level read permission failed)"
-                )
-                return False
-
-        # If not the last part, traverse to the related model
-        if i < len(parts) - 1:
-            try:
-                field = current_model._meta.get_field(part)
-                if hasattr(field, "related_model") and field.related_model:
-                    # Get the related model for the next iteration
-                    current_model = field.related_model
-                else:
-                    # Not a relational field, can't traverse further
-                    remaining_path = ".".join(parts[i + 1 :])
-                    logger.warning(
-                        f"Field '{part}' on {current_model.__name__} is not a "
-                        f"relational field, cannot traverse to '{remaining_path}'"
-                    )
-                    return False
-            except FieldDoesNotExist:
-                logger.warning(
-                    f"Field '{part}' does not exist on model {current_model.__name__}"
-                )
-                return False
+            reason = "model-level read permission failed"
+        logger.debug(f"Permission denied: {current_model.__name__}.{part} ({reason})")
+        return False
 
     return True
 
@@ -520,48 +646,40 @@ def is_field_visible_to_user(model, field_path, user, use_cache=True):
       2. Nested-path permission walk via check_nested_field_permissions.
 
     Pass user=None for anonymous (the snapshot system handles 'guest' role
-    if configured).
+    if configured). For many paths at once use filter_visible_fields_many.
     """
     if is_field_path_sensitive(field_path):
         return False
     return check_nested_field_permissions(model, field_path, user, use_cache=use_cache)
 
 
-def filter_readable_fields(model, fields, user, use_cache=True):
-    """Return the subset of `fields` (list of `__`-paths) that user can read."""
-    return [
-        f
-        for f in fields
-        if is_field_visible_to_user(model, f, user, use_cache=use_cache)
-    ]
-
+def filter_visible_fields_many(model, field_paths, user, use_cache=True):
+    """Batch form of is_field_visible_to_user: the paths this user may see.
 
-def validate_filter_field(model, filter_param):
+    Same two checks, in input order, but the permission walk goes through
+    check_nested_field_permissions_many so snapshots and shared prefixes
+    are resolved once for the whole batch.
     """
-    Validate a filter parameter including nesting depth and field existence.
+    candidates = []
+    for field_path in field_paths:
+        if is_field_path_sensitive(field_path):
+            logger.debug(f"Stripping sensitive field '{field_path}'")
+            continue
+        candidates.append(field_path)
+    allowed = check_nested_field_permissions_many(
+        model, candidates, user, use_cache=use_cache
+    )
+    return [field_path for field_path in candidates if allowed[field_path]]
 
-    Args:
-        model: Django model class
-        filter_param: Filter parameter (e.g., 'author__name__icontains')
 
-    Returns:
-        tuple: (field_path, lookup) or raises ValidationError
-
-    Example:
-        >>> validate_filter_field(Book, 'author__name__icontains')
-        ('author__name', 'icontains')
-        >>> validate_filter_field(Book, 'price__gte')
-        ('price', 'gte')
-    """
-    # Strip _or suffix if present
-    if filter_param.endswith("_or"):
-        filter_param = filter_param[:-3]
+def filter_readable_fields(model, fields, user, use_cache=True):
+    """Return the subset of `fields` (list of `__`-paths) that user can read."""
+    return filter_visible_fields_many(model, fields, user, use_cache=use_cache)
 
-    # Split into field path and lookup
-    parts = filter_param.split("__")
 
-    # Common Django lookups
-    lookups = {
+# Common Django lookups
+_FILTER_LOOKUPS = frozenset(
+    {
         "exact",
         "iexact",
         "contains",
@@ -591,16 +709,79 @@ def validate_filter_field(model, filter_param):
         "regex",
         "iregex",
     }
+)
+
+
+@lru_cache(maxsize=8192)
+def _split_filter_param(filter_param):
+    """Split a filter param into ``(field_path, lookup)``; cached, pure."""
+    # Strip _or suffix if present
+    if filter_param.endswith("_or"):
+        filter_param = filter_param[:-3]
+
+    # Split into field path and lookup
+    parts = filter_param.split("__")
 
     # Check if last part is a lookup
-    if parts[-1] in lookups:
-        field_path = "__".join(parts[:-1])
-        lookup = parts[-1]
-    else:
-        field_path = filter_param
-        lookup = "exact"
+    if parts[-1] in _FILTER_LOOKUPS:
+        return "__".join(parts[:-1]), parts[-1]
+    return filter_param, "exact"
+
+
+def validate_filter_field(model, filter_param):
+    """
+    Validate a filter parameter including nesting depth and field existence.
+
+    Args:
+        model: Django model class
+        filter_param: Filter parameter (e.g., 'author__name__icontains')
+
+    Returns:
+        tuple: (field_path, lookup) or raises ValidationError
+
+    Example:
+        >>> validate_filter_field(Book, 'author__name__icontains')
+        ('author__name', 'icontains')
+        >>> validate_filter_field(Book, 'price__gte')
+        ('price', 'gte')
+    """
+    field_path, lookup = _split_filter_param(filter_param)
 
     # Validate nesting depth
     validate_nesting_depth(field_path)
 
     return field_path, lookup
+
+
+def validate_and_authorize_filter(model, filter_param, user, snapshot=None):
+    """
+    Validate a filter parameter and check read permission along its path.
+
+    Equivalent to :func:`validate_filter_field` followed by
+    :func:`check_nested_field_permissions` on the resulting field path, but
+    the param split and the relationship chain each come from their cache in
+    a single pass.
+
+    Args:
+        model: Django model class
+        filter_param: Filter parameter (e.g., 'author__name__icontains')
+        user: Django user object for permission checking
+        snapshot: Optional already-built snapshot for ``model`` (e.g. the
+            one attached to the request); related models are built as needed
+
+    Returns:
+        tuple: (field_path, lookup, has_permission)
+
+    Raises:
+        ValidationError: If the path exceeds the maximum nesting depth
+    """
+    field_path, lookup = _split_filter_param(filter_param)
+    validate_nesting_depth(field_path)
+
+    steps, broken = _permission_chain(model, field_path)
+    if broken is not None:
+        logger.warning(broken)
+        return field_path, lookup, False
+
+    snapshots = {model: snapshot} if snapshot is not None else {}
+    return field_path, lookup, _authorize_chain(steps, user, snapshots, True)
@@ -253,6 +253,11 @@ class TurboDRFViewSet(*_viewset_bases):
     model = None  # Will be set by the router
     _predicates = []  # Populated by router: within-tenant predicates only
     _tenant_field = None  # Populated by router: mandatory tenant boundary
+    # get_filterset_fields() only narrows model fields, so ORFilterBackend can
+    # drop unknown params without resolving it. A subclass that overrides
+    # filterset_fields / get_filterset_fields is resolved per request again
+    # unless it re-declares this flag as True itself.
+    filterset_fields_within_model = True
 
     # NOTE on @action routes: custom @action methods that call
     # self.get_object() or self.get_queryset() inherit scoping automatically.